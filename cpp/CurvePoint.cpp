@@ -226,6 +226,59 @@ void CurvePoint::multiply(const Uint256 &n) {
 }
 
 
+void CurvePoint::multiplyAdd(const Uint256 &n, const CurvePoint &other, const Uint256 &m) {
+	// Precompute [this*0, this*1, ..., this*15] and [other*0, other*1, ..., other*15]
+	countOps(functionOps);
+	constexpr int tableBits = 4;  // Do not modify
+	constexpr unsigned int tableLen = 1U << tableBits;
+	CurvePoint thisTable[tableLen];  // Default-initialized with ZERO
+	CurvePoint otherTable[tableLen];
+	thisTable[1] = *this;
+	thisTable[2] = *this;
+	otherTable[1] = other;
+	otherTable[2] = other;
+	countOps(36 * curvepointCopyOps);
+	thisTable[2].twice();
+	otherTable[2].twice();
+	for (unsigned int i = 3; i < tableLen; i++) {
+		countOps(loopBodyOps);
+		thisTable[i] = thisTable[i - 1];
+		thisTable[i].add(thisTable[1]);
+		otherTable[i] = otherTable[i - 1];
+		otherTable[i].add(otherTable[1]);
+		countOps(4 * arithmeticOps);
+		countOps(2 * curvepointCopyOps);
+	}
+	
+	// Process tableBits of both scalars per iteration (windowed method with Shamir's trick)
+	*this = ZERO;
+	countOps(1 * curvepointCopyOps);
+	for (int i = Uint256::NUM_WORDS * 32 - tableBits; i >= 0; i -= tableBits) {
+		countOps(loopBodyOps);
+		unsigned int thisInc  = (n.value[i >> 5] >> (i & 31)) & (tableLen - 1);
+		unsigned int otherInc = (m.value[i >> 5] >> (i & 31)) & (tableLen - 1);
+		CurvePoint q = ZERO;  // Dummy initial values
+		CurvePoint r = ZERO;
+		countOps(10 * arithmeticOps);
+		countOps(2 * curvepointCopyOps);
+		for (unsigned int j = 0; j < tableLen; j++) {
+			countOps(loopBodyOps);
+			q.replace(thisTable [j], static_cast<uint32_t>(j == thisInc ));
+			r.replace(otherTable[j], static_cast<uint32_t>(j == otherInc));
+			countOps(2 * arithmeticOps);
+		}
+		this->add(q);
+		this->add(r);
+		if (i != 0) {
+			for (int j = 0; j < tableBits; j++) {
+				countOps(loopBodyOps);
+				this->twice();
+			}
+		}
+	}
+}
+
+
 void CurvePoint::normalize() {
 	/* 
 	 * Algorithm pseudocode:
@@ -72,6 +72,11 @@ class CurvePoint final {
 	public: void multiply(const Uint256 &n);
 	
 	
+	// Sets this point to (this * n + other * m), sharing the doublings between both multiplications.
+	// The resulting state is usually not normalized. Constant-time with respect to all values.
+	public: void multiplyAdd(const Uint256 &n, const CurvePoint &other, const Uint256 &m);
+	
+	
 	// Normalizes the coordinates of this point. Idempotent operation.
 	// Constant-time with respect to this value.
 	public: void normalize();
@@ -361,6 +361,42 @@ static void testMultiply() {
 }
 
 
+static void testMultiplyAdd() {
+	const vector<ThreeStrings> cases{
+		{"0000000000000000000000000000000000000000000000000000000000000000", "0000000000000000000000000000000000000000000000000000000000000000", "0000000000000000000000000000000000000000000000000000000000000001"},
+		{"0000000000000000000000000000000000000000000000000000000000000001", "0000000000000000000000000000000000000000000000000000000000000000", "0000000000000000000000000000000000000000000000000000000000000002"},
+		{"0000000000000000000000000000000000000000000000000000000000000000", "0000000000000000000000000000000000000000000000000000000000000001", "0000000000000000000000000000000000000000000000000000000000000003"},
+		{"0000000000000000000000000000000000000000000000000000000000000002", "0000000000000000000000000000000000000000000000000000000000000001", "FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD036413F"},
+		{"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364140", "0000000000000000000000000000000000000000000000000000000000000001", "0000000000000000000000000000000000000000000000000000000000000001"},
+		{"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF", "FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF", "000000000000000000000000000000000000000000000000000000000000000F"},
+		{"45528A55356F7C32CA753F1E58627BC33863670A1072D9C8DD0663EB5691D87F", "11D6DD13D560E703C7F0189140DF2F692B603EF57A5E10E29C3E163ACD1E8FF8", "E1E1DD6FBA9D293B4F5F46BE5A3F05A7BCE9CDBD8993BC0282DCF6B975D285F1"},
+		{"3CBD5DE8E80196F3F5DB4D925A29638E4BFE4A9A848A9424BAD5C46136837C1F", "EFA4125849134857FBC1A97675A43B5DE6C1D268E2CA7AB1E179DB25F13DE00C", "B177E15F7CF844C240A7749F332DF50A692A372D6AFFD786629686540C8E73F2"},
+		{"9806E0E601FDE9777CFBA9BE56FE90453023E6B08F5BE6CB18555156DE3AB5C3", "B26C14ECABF65120BC8786A981EDAD985E8C1D42B146D7F66A8759919B02AE11", "F56A9E89525FF39CFE2D18BADA4E050D0875BF2A2C97237BAC9B0F31D191E250"},
+	};
+	for (const ThreeStrings &tc : cases) {
+		// Let other = G * tc.c, and check G * tc.a + other * tc.b against separate multiplications
+		Uint256 n(tc.a);
+		Uint256 m(tc.b);
+		CurvePoint other = CurvePoint::G;
+		other.multiply(Uint256(tc.c));
+		other.normalize();
+		
+		CurvePoint expect = CurvePoint::G;
+		expect.multiply(n);
+		CurvePoint temp = other;
+		temp.multiply(m);
+		expect.add(temp);
+		expect.normalize();
+		
+		CurvePoint p = CurvePoint::G;
+		p.multiplyAdd(n, other, m);
+		p.normalize();
+		assert(p == expect);
+		numTestCases++;
+	}
+}
+
+
 static void testMultiplyModOrder() {
 	const vector<ThreeStrings> cases{
 		{"00000000000000000000000000000000000000054C9DC1717D84540608A237D9", "0000158D3F4383CB7CAC54E74928B4BFDF58224F42A01A4C6318B0A3BB2BBD4B", "231F5FC63A0601A4931488454123D6461C58D63A0632C5705005B631A8FBC8A4"},
@@ -1124,6 +1160,7 @@ int main() {
 	testTwice();
 	testAdd();
 	testMultiply();
+	testMultiplyAdd();
 	testMultiplyModOrder();
 	testIsOnCurve();
 	testPrivateExponentToPublicPoint();
@@ -121,12 +121,9 @@ bool Ecdsa::verify(const CurvePoint &publicKey, const Sha256Hash &msgHash, const
 	countOps(4 * uint256CopyOps);
 	
 	CurvePoint p = CurvePoint::G;
-	q = publicKey;
-	p.multiply(u1);
-	q.multiply(u2);
-	p.add(q);
+	p.multiplyAdd(u1, publicKey, u2);
 	p.normalize();
-	countOps(2 * curvepointCopyOps);
+	countOps(1 * curvepointCopyOps);
 	
 	Uint256 px(p.x);
 	px.subtract(order, static_cast<uint32_t>(px >= order));
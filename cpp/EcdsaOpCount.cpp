@@ -2,6 +2,7 @@
  * A runnable main program that calculates and prints the approximate
  * number of 32-bit arithmetic operations needed to perform
  * elliptic curve point multiplication, in this C++ implementation.
+ * Run with the argument "--csv" to print comma-separated values instead.
  * 
  * Bitcoin cryptography library
  * Copyright (c) Project Nayuki
@@ -10,8 +11,9 @@
  * https://github.com/nayuki/Bitcoin-Cryptography-Library
  */
 
-#include <cstddef>
+#include <algorithm>
 #include <cstdlib>
+#include <cstring>
 #include <iostream>
 #include <string>
 #include "CountOps.hpp"
@@ -24,6 +26,7 @@
 
 
 static long long opsCount;
+static bool csvOutput = false;
 
 
 void countOps(long n) {
@@ -32,13 +35,21 @@ void countOps(long n) {
 
 
 static void printOps(const char *name);
+static void endGroup();
 static void doUint256();
 static void doFieldInt();
 static void doCurvePoint();
 static void doEcdsa();
 
 
-int main() {
+int main(int argc, char *argv[]) {
+	if (argc == 2 && std::strcmp(argv[1], "--csv") == 0) {
+		csvOutput = true;
+		std::cout << "name,ops\n";
+	} else if (argc != 1) {
+		std::cerr << "Usage: " << argv[0] << " [--csv]" << std::endl;
+		return EXIT_FAILURE;
+	}
 	doUint256();
 	doFieldInt();
 	doCurvePoint();
@@ -109,7 +120,7 @@ static void doUint256() {
 		x.reciprocal(y);
 		printOps("uiReciprocal");
 	}
-	std::cout << std::endl;
+	endGroup();
 }
 
 
@@ -174,7 +185,7 @@ static void doFieldInt() {
 		x.reciprocal();
 		printOps("fiReciprocal");
 	}
-	std::cout << std::endl;
+	endGroup();
 }
 
 
@@ -219,6 +230,15 @@ static void doCurvePoint() {
 		x.multiply(y);
 		printOps("cpMultiply");
 	}
+	{
+		CurvePoint x = CurvePoint::G;
+		CurvePoint y = CurvePoint::G;
+		Uint256 n = Uint256::ONE;
+		Uint256 m = Uint256::ONE;
+		opsCount = 0;
+		x.multiplyAdd(n, y, m);
+		printOps("cpMultiplyAdd");
+	}
 	{
 		CurvePoint x = CurvePoint::G;
 		opsCount = 0;
@@ -231,7 +251,7 @@ static void doCurvePoint() {
 		x.isOnCurve();
 		printOps("cpIsOnCurve");
 	}
-	std::cout << std::endl;
+	endGroup();
 }
 
 
@@ -254,15 +274,32 @@ static void doEcdsa() {
 		Ecdsa::verify(pubKey, msgHash, r, s);
 		printOps("edVerify");
 	}
-	std::cout << std::endl;
+	endGroup();
 }
 
 
 static void printOps(const char *name) {
-	std::string s = std::to_string(opsCount);
-	while (s.size() < 9)
-		s.insert(0, " ", 1);
-	for (std::size_t i = s.size(); i >= 4; i -= 3)
-		s.insert(i - 3, " ", 1);
-	std::cout << s << "  " << name << std::endl;
+	if (csvOutput) {
+		std::cout << name << "," << opsCount << "\n";
+		return;
+	}
+	
+	// Build the digits from least to most significant, inserting a space after every third
+	std::string s;
+	long long n = opsCount;
+	for (int i = 0; i == 0 || n != 0; i++, n /= 10) {
+		if (i > 0 && i % 3 == 0)
+			s.push_back(' ');
+		s.push_back(static_cast<char>('0' + n % 10));
+	}
+	while (s.size() < 11)
+		s.push_back(' ');
+	std::reverse(s.begin(), s.end());
+	std::cout << s << "  " << name << "\n";
+}
+
+
+static void endGroup() {
+	if (!csvOutput)
+		std::cout << "\n";
 }